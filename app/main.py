@@ -1,15 +1,63 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Optional
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pathlib import Path
 from app.models import MathQuery, MathResponse
 from app.pattern_matcher import PatternMatcher
 from app.nlp_processor import NLPProcessor
+from app.utils import NORMALIZER
+
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+
+# Processors are built once per process, on first use or when a pool worker starts
+# (see lifespan), so importing the app stays cheap
+pattern_matcher: Optional[PatternMatcher] = None
+nlp_processor: Optional[NLPProcessor] = None
+_processors_lock = threading.Lock()
+
+def _init_processors() -> None:
+    """Build the parsers for this process if it doesn't have them yet"""
+    global pattern_matcher, nlp_processor
+    if nlp_processor is not None:
+        return
+    with _processors_lock:
+        if nlp_processor is None:
+            pattern_matcher = PatternMatcher()
+            nlp_processor = NLPProcessor()
+
+# Parsing is CPU-bound pure Python (SymPy holds the GIL), so it runs in worker
+# processes. Until the pool is started, it falls back to the default thread pool.
+executor: Optional[ProcessPoolExecutor] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the parsing worker pool for the lifetime of the app"""
+    global executor
+    # Workers are spawned rather than forked: the pool only starts them on the first
+    # submit, when server threads are already running. Each builds its own parsers.
+    executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_processors
+    )
+    yield
+    executor.shutdown()
+    executor = None
 
 app = FastAPI(
     title="Math NLP Parser API",
     description="Convert natural language mathematical expressions to LaTeX",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware for frontend integration
@@ -21,9 +69,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize processors
-pattern_matcher = PatternMatcher()
-nlp_processor = NLPProcessor()
+def _parse_sync(text: str) -> Optional[Dict]:
+    """Pattern matching first, then NLP fallback (runs in a worker process)"""
+    _init_processors()
+    
+    # Normalize once and hand the same text to both parsers
+    text = NORMALIZER.normalize(text)
+    
+    # Step 1: Try pattern matching (fast and accurate for common patterns)
+    result = pattern_matcher.parse(text, already_normalized=True)
+    
+    if result:
+        return result
+    
+    # Step 2: Fall back to NLP processing (for complex/ambiguous queries)
+    return nlp_processor.parse(text, already_normalized=True)
+
+def _parse_pattern_sync(text: str) -> Optional[Dict]:
+    """Pattern matching only (runs in a worker process)"""
+    _init_processors()
+    return pattern_matcher.parse(text)
+
+def _parse_nlp_sync(text: str) -> Optional[Dict]:
+    """NLP processing only (runs in a worker process)"""
+    _init_processors()
+    return nlp_processor.parse(text)
+
+async def _run_parser(parser: Callable[[str], Optional[Dict]], text: str) -> Optional[Dict]:
+    """Run a module-level parse function off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, parser, text)
 
 @app.get("/")
 def read_root():
@@ -41,7 +116,7 @@ def health_check():
     return {"status": "healthy"}
 
 @app.post("/parse", response_model=MathResponse)
-def parse_math_expression(query: MathQuery):
+async def parse_math_expression(query: MathQuery):
     """
     Parse natural language mathematical expression to LaTeX
     
@@ -52,28 +127,22 @@ def parse_math_expression(query: MathQuery):
     if not text:
         raise HTTPException(status_code=400, detail="Empty query text")
     
-    # Step 1: Try pattern matching (fast and accurate for common patterns)
-    result = pattern_matcher.parse(text)
-    
-    if result:
-        return MathResponse(**result)
-    
-    # Step 2: Fall back to NLP processing (for complex/ambiguous queries)
-    result = nlp_processor.parse(text)
+    # Pattern matching, then NLP fallback
+    result = await _run_parser(_parse_sync, text)
     
     if result:
         return MathResponse(**result)
     
-    # Step 3: If both fail, return error
+    # If both fail, return error
     raise HTTPException(
         status_code=422,
         detail="Could not parse the mathematical expression. Please try rephrasing."
     )
 
 @app.post("/parse/pattern-only", response_model=MathResponse)
-def parse_pattern_only(query: MathQuery):
+async def parse_pattern_only(query: MathQuery):
     """Parse using only pattern matching (for testing)"""
-    result = pattern_matcher.parse(query.text)
+    result = await _run_parser(_parse_pattern_sync, query.text)
     
     if result:
         return MathResponse(**result)
@@ -84,9 +153,9 @@ def parse_pattern_only(query: MathQuery):
     )
 
 @app.post("/parse/nlp-only", response_model=MathResponse)
-def parse_nlp_only(query: MathQuery):
+async def parse_nlp_only(query: MathQuery):
     """Parse using only NLP (for testing)"""
-    result = nlp_processor.parse(query.text)
+    result = await _run_parser(_parse_nlp_sync, query.text)
     
     if result:
         return MathResponse(**result)
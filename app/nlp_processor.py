@@ -1,20 +1,42 @@
-import spacy
-from typing import Optional, Dict, List
-import sympy as sp
+import logging
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 import re
-from app.utils import TextNormalizer
+from app.utils import NORMALIZER, SYMPIFY_ERRORS, sympify_latex
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=64)
+def _compile_var_tail(var: str) -> re.Pattern:
+    """Compile (once per variable) the pattern matching a trailing variable reference"""
+    return re.compile(rf'\b{re.escape(var)}\s*$')
+
+
+@lru_cache(maxsize=64)
+def _compile_word_alternation(words: Tuple[str, ...]) -> re.Pattern:
+    """Compile a single whole-word alternation matching any of the given words"""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, words)) + r')\b')
+
+
+@lru_cache(maxsize=None)
+def _load_spacy():
+    """Load the spaCy pipeline once per process, shared by every NLPProcessor"""
+    # Imported here so that importing this module doesn't pay for spaCy
+    import spacy
+    try:
+        # Only the tokenizer and vocab are kept: nothing reads the tagger/parser/NER output
+        return spacy.load("en_core_web_sm",
+                          exclude=["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"])
+    except OSError:
+        logger.warning("spaCy model not loaded.")
+        return None
+
 
 class NLPProcessor:
     """NLP-based processor for complex mathematical expressions"""
     
     def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            print("Warning: spaCy model not loaded. NLP fallback will not work.")
-            self.nlp = None
-        
-        self.normalizer = TextNormalizer()
+        self.normalizer = NORMALIZER
         
         # Mathematical keywords mapping
         self.math_operations = {
@@ -34,6 +56,16 @@ class NLPProcessor:
             'partial': 'partial_derivative',
         }
         
+        # All operation keywords in one alternation (longest first), plus each operation's
+        # precedence so a single scan still resolves ties in mapping order. The lookahead
+        # tries every position, so keywords that overlap ("partialimit") are all found;
+        # only a shorter keyword at the same position is skipped, and those map to the
+        # same operation as the longer one.
+        self._op_regex = re.compile('(?=(' + '|'.join(
+            re.escape(keyword) for keyword in sorted(self.math_operations, key=len, reverse=True)
+        ) + '))')
+        self._op_rank = {op: rank for rank, op in enumerate(dict.fromkeys(self.math_operations.values()))}
+        
         self.function_words = ['sin', 'cos', 'tan', 'log', 'ln', 'exp', 'sqrt', 
                                'sec', 'csc', 'cot', 'arcsin', 'arccos', 'arctan']
         
@@ -41,71 +73,118 @@ class NLPProcessor:
         self.power_indicators = ['squared', 'square', 'cubed', 'cube', 'power', 'exponent']
         
         # Common filler words to remove
-        self.filler_words = ['i', 'want', 'to', 'find', 'the', 'please', 'can', 'you', 
-                            'calculate', 'compute', 'determine', 'what', 'is', 'help', 
-                            'me', 'solve', 'get', 'give', 'show']
-    
-    def parse(self, text: str) -> Optional[Dict]:
-        """Use NLP to parse mathematical expressions"""
-        if not self.nlp:
-            return None
+        self.filler_words = frozenset(['i', 'want', 'to', 'find', 'the', 'please', 'can', 'you', 
+                                       'calculate', 'compute', 'determine', 'what', 'is', 'help', 
+                                       'me', 'solve', 'get', 'give', 'show'])
         
-        # Normalize text first
-        text = self.normalizer.normalize(text)
-        text = text.lower().strip()
+        # Operation keywords AND common filler words removed from each kind of expression
+        filler = tuple(sorted(self.filler_words))
+        self._remove_integral = ('integrate', 'integral', 'integration', 'of', 'with', 'respect', 'to', 'wrt') + filler
+        self._remove_derivative = ('derivative', 'differentiate', 'diff', 'derive', 'of', 'with', 'respect', 'to', 'wrt') + filler
+        self._remove_partial = ('partial', 'derivative', 'of', 'with', 'respect', 'to', 'wrt') + filler
+        self._remove_summation = ('sum', 'summation', 'sigma', 'from', 'of', 'to', 'equals') + filler
+        self._remove_product = ('product', 'from', 'of', 'to', 'equals') + filler
         
-        doc = self.nlp(text)
+        # Precompiled regexes for the per-request helpers
+        self._re_wrt = re.compile(r'with\s+respect\s+to\s+([a-zA-Z])')
+        self._re_wrt2 = re.compile(r'wrt\s+([a-zA-Z])')
+        self._re_wrt3 = re.compile(r'w\.r\.t\.?\s+([a-zA-Z])')
+        self._re_dvar = re.compile(r'd([a-zA-Z])\b')
+        self._variable_patterns = (self._re_wrt, self._re_wrt2, self._re_wrt3, self._re_dvar)
+        self._re_single = re.compile(r'\b([a-zA-Z])\b')
+        self._re_ws = re.compile(r'\s+')
+        self._re_pow_sq = re.compile(r'([a-zA-Z0-9]+)\s+(?:squared|square)')
+        self._re_pow_cube = re.compile(r'([a-zA-Z0-9]+)\s+(?:cubed|cube)')
+        self._re_pow_n = re.compile(r'([a-zA-Z0-9]+)\s+to\s+the\s+(?:power\s+of\s+)?(\d+)')
+        self._re_implicit_num = re.compile(r'(\d+)([a-zA-Z])')
+        self._re_implicit_var = re.compile(r'([a-zA-Z](?:\*\*\d+)?)\s+([a-zA-Z])')
+        self._limit_re = re.compile(r'(?:lim|limit|as)\s+([a-zA-Z])\s+(?:approaches|goes\s+to|tends\s+to|->)\s+([a-zA-Z0-9]+|infinity|inf)\s+(?:of\s+)?(.+)')
+        self._sumprod_re = re.compile(r'(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)')
         
-        # Extract operation type
-        operation = self._extract_operation(text)
+        # Operation words and "func arg" calls, each rewritten in a single pass
+        self._word_ops_map = {
+            'plus': '+',
+            'minus': '-',
+            'times': '*',
+            'multiply': '*',
+            'divided by': '/',
+            'over': '/',
+        }
+        self._word_ops = re.compile(r'\b(plus|minus|times|multiply|divided by|over)\b')
+        self._funcs_re = re.compile(
+            r'\b(' + '|'.join(re.escape(func) for func in self.function_words) + r')\s+([a-zA-Z0-9]+)'
+        )
+        
+        # One compiled alternation per set of removed words
+        self._remove_words = {
+            'integral': self._remove_integral,
+            'derivative': self._remove_derivative,
+            'partial_derivative': self._remove_partial,
+            'summation': self._remove_summation,
+            'product': self._remove_product,
+            'filler': filler,
+        }
+        self._remove_patterns = {
+            key: _compile_word_alternation(words) for key, words in self._remove_words.items()
+        }
+        
+        # Repeated queries skip normalization and operation extraction. The cache holds the
+        # bound method and so the instance: a reference cycle only the cyclic GC frees, which
+        # is fine for the one long-lived processor per process.
+        self._normalize_and_classify = lru_cache(maxsize=4096)(self._normalize_and_classify)
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded lazily since no parse branch needs a Doc"""
+        return _load_spacy()
+    
+    def parse(self, text: str, already_normalized: bool = False) -> Optional[Dict]:
+        """Use NLP to parse mathematical expressions"""
+        # Normalize text (unless the caller already did) and extract operation type
+        text, operation = self._normalize_and_classify(text, already_normalized)
         
         # Try to parse based on operation
         if operation == 'integral':
-            return self._parse_integral_nlp(text, doc)
+            return self._parse_integral_nlp(text)
         elif operation == 'derivative':
-            return self._parse_derivative_nlp(text, doc)
+            return self._parse_derivative_nlp(text)
         elif operation == 'partial_derivative':
-            return self._parse_partial_derivative_nlp(text, doc)
+            return self._parse_partial_derivative_nlp(text)
         elif operation == 'summation':
-            return self._parse_summation_nlp(text, doc)
+            return self._parse_summation_nlp(text)
         elif operation == 'product':
-            return self._parse_product_nlp(text, doc)
+            return self._parse_product_nlp(text)
         elif operation == 'limit':
-            return self._parse_limit_nlp(text, doc)
+            return self._parse_limit_nlp(text)
         else:
             # Try to parse as a simple expression
             return self._parse_simple_expression(text)
         
         return None
     
+    def _normalize_and_classify(self, text: str, already_normalized: bool) -> Tuple[str, Optional[str]]:
+        """Normalize text and extract its operation (memoized per instance)"""
+        if not already_normalized:
+            text = self.normalizer.normalize(text)
+        text = text.lower().strip()
+        return text, self._extract_operation(text)
+    
     def _extract_operation(self, text: str) -> Optional[str]:
         """Extract the main mathematical operation from text"""
-        text_lower = text.lower()
-        
-        # Check for operation keywords
-        for keyword, operation in self.math_operations.items():
-            if keyword in text_lower:
-                return operation
-        
-        return None
+        # Find every operation keyword in one pass, then keep the highest-precedence one
+        found = {self.math_operations[keyword] for keyword in self._op_regex.findall(text)}
+        return min(found, key=self._op_rank.__getitem__, default=None)
     
     def _extract_variable(self, text: str) -> str:
         """Extract variable name (usually single letter)"""
         # Look for "with respect to X", "wrt X", "dx", etc.
-        patterns = [
-            r'with\s+respect\s+to\s+([a-zA-Z])',
-            r'wrt\s+([a-zA-Z])',
-            r'w\.r\.t\.?\s+([a-zA-Z])',
-            r'd([a-zA-Z])\b',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in self._variable_patterns:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         
         # Look for single letters in the text (excluding filler words)
-        single_letters = re.findall(r'\b([a-zA-Z])\b', text)
+        single_letters = self._re_single.findall(text)
         if single_letters:
             # Filter out filler words
             valid_letters = [l for l in single_letters if l not in self.filler_words]
@@ -119,65 +198,66 @@ class NLPProcessor:
         
         return 'x'  # Default
     
-    def _clean_expression(self, text: str, remove_words: List[str]) -> str:
+    def _clean_expression(self, text: str, key: str, extra_words: Tuple[str, ...] = (),
+                          keep_word: Optional[str] = None) -> str:
         """Clean expression by removing operation keywords"""
         expr = text
-        for word in remove_words:
-            expr = re.sub(r'\b' + word + r'\b', ' ', expr, flags=re.IGNORECASE)
+        if extra_words:
+            expr = _compile_word_alternation(extra_words).sub(' ', expr)
+        
+        pattern = self._remove_patterns[key]
+        if keep_word in self._remove_words[key]:
+            # e.g. the index "i" of a sum, which is otherwise a filler word
+            pattern = _compile_word_alternation(tuple(w for w in self._remove_words[key] if w != keep_word))
+        expr = pattern.sub(' ', expr)
         
         # Clean up extra spaces
-        expr = re.sub(r'\s+', ' ', expr).strip()
+        expr = self._re_ws.sub(' ', expr).strip()
         return expr
     
     def _preprocess_math_text(self, text: str) -> str:
         """Preprocess mathematical text for sympify"""
         # Handle power words
-        text = re.sub(r'([a-zA-Z0-9]+)\s+(?:squared|square)', r'\1**2', text)
-        text = re.sub(r'([a-zA-Z0-9]+)\s+(?:cubed|cube)', r'\1**3', text)
-        text = re.sub(r'([a-zA-Z0-9]+)\s+to\s+the\s+(?:power\s+of\s+)?(\d+)', r'\1**\2', text)
+        text = self._re_pow_sq.sub(r'\1**2', text)
+        text = self._re_pow_cube.sub(r'\1**3', text)
+        text = self._re_pow_n.sub(r'\1**\2', text)
         
         # Handle operations
-        text = text.replace('plus', '+').replace('minus', '-')
-        text = text.replace('times', '*').replace('multiply', '*')
-        text = text.replace('divided by', '/').replace('over', '/')
+        text = self._word_ops.sub(lambda m: self._word_ops_map[m.group(1)], text)
         
         # Handle functions
-        for func in self.function_words:
-            text = re.sub(rf'\b{func}\s+([a-zA-Z0-9]+)', rf'{func}(\1)', text)
+        text = self._funcs_re.sub(r'\1(\2)', text)
         
         # Handle implicit multiplication "2x" -> "2*x"
-        text = re.sub(r'(\d+)([a-zA-Z])', r'\1*\2', text)
+        text = self._re_implicit_num.sub(r'\1*\2', text)
         
         # Handle "x y" -> "x*y" for implicit multiplication
-        text = re.sub(r'([a-zA-Z](?:\*\*\d+)?)\s+([a-zA-Z])', r'\1*\2', text)
+        text = self._re_implicit_var.sub(r'\1*\2', text)
         
         return text
     
-    def _parse_integral_nlp(self, text: str, doc) -> Optional[Dict]:
+    def _parse_integral_nlp(self, text: str) -> Optional[Dict]:
         """Parse integral using NLP"""
         try:
             var = self._extract_variable(text)
             
             # Remove operation words AND common filler words
-            remove_words = ['integrate', 'integral', 'integration', 'of', 'with', 'respect', 'to', 'wrt', 
-                            f'd{var}'] + self.filler_words
-            expr_text = self._clean_expression(text, remove_words)
+            expr_text = self._clean_expression(text, 'integral', (f'd{var}',))
             
             # Preprocess
             expr_text = self._preprocess_math_text(expr_text)
             
             # Remove the variable reference at the end if present
-            expr_text = re.sub(rf'\b{var}\s*$', '', expr_text).strip()
+            expr_text = _compile_var_tail(var).sub('', expr_text).strip()
             
             if not expr_text:
                 return None
             
             # Try to sympify
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_text)
+            expr_latex, expr_plain = sympify_latex(expr_text)
             
-            latex = f"\\int {sp.latex(expr)} \\, d{var}"
-            plain = f"Integral of {expr} with respect to {var}"
+            latex = f"\\int {expr_latex} \\, d{var}"
+            plain = f"Integral of {expr_plain} with respect to {var}"
             
             return {
                 'latex': latex,
@@ -185,34 +265,31 @@ class NLPProcessor:
                 'method_used': 'nlp',
                 'confidence': 0.7
             }
-        except Exception as e:
-            print(f"NLP integral parsing error: {e}")
+        except SYMPIFY_ERRORS as e:
+            logger.debug("NLP integral parsing error: %s", e)
             return None
     
-    def _parse_derivative_nlp(self, text: str, doc) -> Optional[Dict]:
+    def _parse_derivative_nlp(self, text: str) -> Optional[Dict]:
         """Parse derivative using NLP"""
         try:
             var = self._extract_variable(text)
             
             # Remove operation words AND common filler words
-            remove_words = ['derivative', 'differentiate', 'diff', 'derive', 'of', 'with', 'respect', 'to', 'wrt',
-                            f'd{var}'] + self.filler_words
-            expr_text = self._clean_expression(text, remove_words)
+            expr_text = self._clean_expression(text, 'derivative', (f'd{var}',))
             
             # Preprocess
             expr_text = self._preprocess_math_text(expr_text)
             
             # Remove the variable reference
-            expr_text = re.sub(rf'\b{var}\s*$', '', expr_text).strip()
+            expr_text = _compile_var_tail(var).sub('', expr_text).strip()
             
             if not expr_text:
                 return None
             
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_text)
+            expr_latex, expr_plain = sympify_latex(expr_text)
             
-            latex = f"\\frac{{d}}{{d{var}}} {sp.latex(expr)}"
-            plain = f"Derivative of {expr} with respect to {var}"
+            latex = f"\\frac{{d}}{{d{var}}} {expr_latex}"
+            plain = f"Derivative of {expr_plain} with respect to {var}"
             
             return {
                 'latex': latex,
@@ -220,18 +297,17 @@ class NLPProcessor:
                 'method_used': 'nlp',
                 'confidence': 0.7
             }
-        except Exception as e:
-            print(f"NLP derivative parsing error: {e}")
+        except SYMPIFY_ERRORS as e:
+            logger.debug("NLP derivative parsing error: %s", e)
             return None
     
-    def _parse_partial_derivative_nlp(self, text: str, doc) -> Optional[Dict]:
+    def _parse_partial_derivative_nlp(self, text: str) -> Optional[Dict]:
         """Parse partial derivative using NLP"""
         try:
             var = self._extract_variable(text)
             
             # Remove operation words AND common filler words
-            remove_words = ['partial', 'derivative', 'of', 'with', 'respect', 'to', 'wrt'] + self.filler_words
-            expr_text = self._clean_expression(text, remove_words)
+            expr_text = self._clean_expression(text, 'partial_derivative')
             
             # Preprocess
             expr_text = self._preprocess_math_text(expr_text)
@@ -239,11 +315,10 @@ class NLPProcessor:
             if not expr_text:
                 return None
             
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_text)
+            expr_latex, expr_plain = sympify_latex(expr_text)
             
-            latex = f"\\frac{{\\partial}}{{\\partial {var}}} {sp.latex(expr)}"
-            plain = f"Partial derivative of {expr} with respect to {var}"
+            latex = f"\\frac{{\\partial}}{{\\partial {var}}} {expr_latex}"
+            plain = f"Partial derivative of {expr_plain} with respect to {var}"
             
             return {
                 'latex': latex,
@@ -251,15 +326,15 @@ class NLPProcessor:
                 'method_used': 'nlp',
                 'confidence': 0.65
             }
-        except Exception as e:
-            print(f"NLP partial derivative parsing error: {e}")
+        except SYMPIFY_ERRORS as e:
+            logger.debug("NLP partial derivative parsing error: %s", e)
             return None
     
-    def _parse_summation_nlp(self, text: str, doc) -> Optional[Dict]:
+    def _parse_summation_nlp(self, text: str) -> Optional[Dict]:
         """Parse summation using NLP"""
         try:
             # Extract summation variable
-            var_match = re.search(r'(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)', text)
+            var_match = self._sumprod_re.search(text)
             
             if not var_match:
                 return None
@@ -268,23 +343,20 @@ class NLPProcessor:
             start = var_match.group(2)
             end = var_match.group(3)
             
-            # Extract expression
-            remove_words = ['sum', 'summation', 'sigma', 'from', 'of', 'to', 'equals', start, end] + self.filler_words
-            expr_text = self._clean_expression(text, remove_words)
-            expr_text = expr_text.replace(var, '').replace('=', '').strip()
+            # Extract expression: cut out the "from i = 1 to n" bounds, keep the rest
+            expr_text = text[:var_match.start()] + ' ' + text[var_match.end():]
+            expr_text = self._clean_expression(expr_text, 'summation', keep_word=var)
             
             # Preprocess
             expr_text = self._preprocess_math_text(expr_text)
-            expr_text = expr_text.replace(var, f'{var}')  # Put var back
             
             if not expr_text:
                 expr_text = var
             
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_text)
+            expr_latex, expr_plain = sympify_latex(expr_text)
             
-            latex = f"\\sum_{{{var}={start}}}^{{{end}}} {sp.latex(expr)}"
-            plain = f"Sum from {var}={start} to {end} of {expr}"
+            latex = f"\\sum_{{{var}={start}}}^{{{end}}} {expr_latex}"
+            plain = f"Sum from {var}={start} to {end} of {expr_plain}"
             
             return {
                 'latex': latex,
@@ -292,15 +364,15 @@ class NLPProcessor:
                 'method_used': 'nlp',
                 'confidence': 0.65
             }
-        except Exception as e:
-            print(f"NLP summation parsing error: {e}")
+        except SYMPIFY_ERRORS as e:
+            logger.debug("NLP summation parsing error: %s", e)
             return None
     
-    def _parse_product_nlp(self, text: str, doc) -> Optional[Dict]:
+    def _parse_product_nlp(self, text: str) -> Optional[Dict]:
         """Parse product using NLP"""
         try:
             # Extract product variable
-            var_match = re.search(r'(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)', text)
+            var_match = self._sumprod_re.search(text)
             
             if not var_match:
                 return None
@@ -309,23 +381,20 @@ class NLPProcessor:
             start = var_match.group(2)
             end = var_match.group(3)
             
-            # Extract expression
-            remove_words = ['product', 'from', 'of', 'to', 'equals', start, end] + self.filler_words
-            expr_text = self._clean_expression(text, remove_words)
-            expr_text = expr_text.replace(var, '').replace('=', '').strip()
+            # Extract expression: cut out the "from i = 1 to n" bounds, keep the rest
+            expr_text = text[:var_match.start()] + ' ' + text[var_match.end():]
+            expr_text = self._clean_expression(expr_text, 'product', keep_word=var)
             
             # Preprocess
             expr_text = self._preprocess_math_text(expr_text)
-            expr_text = expr_text.replace(var, f'{var}')
             
             if not expr_text:
                 expr_text = var
             
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_text)
+            expr_latex, expr_plain = sympify_latex(expr_text)
             
-            latex = f"\\prod_{{{var}={start}}}^{{{end}}} {sp.latex(expr)}"
-            plain = f"Product from {var}={start} to {end} of {expr}"
+            latex = f"\\prod_{{{var}={start}}}^{{{end}}} {expr_latex}"
+            plain = f"Product from {var}={start} to {end} of {expr_plain}"
             
             return {
                 'latex': latex,
@@ -333,15 +402,15 @@ class NLPProcessor:
                 'method_used': 'nlp',
                 'confidence': 0.65
             }
-        except Exception as e:
-            print(f"NLP product parsing error: {e}")
+        except SYMPIFY_ERRORS as e:
+            logger.debug("NLP product parsing error: %s", e)
             return None
     
-    def _parse_limit_nlp(self, text: str, doc) -> Optional[Dict]:
+    def _parse_limit_nlp(self, text: str) -> Optional[Dict]:
         """Parse limit using NLP - FIXED v2"""
         try:
             # More flexible pattern
-            var_match = re.search(r'(?:lim|limit|as)\s+([a-zA-Z])\s+(?:approaches|goes\s+to|tends\s+to|->)\s+([a-zA-Z0-9]+|infinity|inf)\s+(?:of\s+)?(.+)', text)
+            var_match = self._limit_re.search(text)
             
             if not var_match:
                 return None
@@ -355,8 +424,7 @@ class NLPProcessor:
                 approach = '\\infty'
             
             # Remove common filler words only
-            remove_words = self.filler_words
-            expr_text = self._clean_expression(expr_text, remove_words)
+            expr_text = self._clean_expression(expr_text, 'filler')
             
             # Preprocess the expression
             expr_text = self._preprocess_math_text(expr_text)
@@ -365,11 +433,10 @@ class NLPProcessor:
             if not expr_text:
                 return None
             
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_text)
+            expr_latex, expr_plain = sympify_latex(expr_text)
             
-            latex = f"\\lim_{{{var} \\to {approach}}} {sp.latex(expr)}"
-            plain = f"Limit as {var} approaches {approach} of {expr}"
+            latex = f"\\lim_{{{var} \\to {approach}}} {expr_latex}"
+            plain = f"Limit as {var} approaches {approach} of {expr_plain}"
             
             return {
                 'latex': latex,
@@ -377,28 +444,27 @@ class NLPProcessor:
                 'method_used': 'nlp',
                 'confidence': 0.7
             }
-        except Exception as e:
-            print(f"NLP limit parsing error: {e}")
+        except SYMPIFY_ERRORS as e:
+            logger.debug("NLP limit parsing error: %s", e)
             return None
     
     def _parse_simple_expression(self, text: str) -> Optional[Dict]:
         """Try to parse as a simple mathematical expression"""
         try:
             # Remove filler words first
-            expr_text = self._clean_expression(text, self.filler_words)
+            expr_text = self._clean_expression(text, 'filler')
             
             # Preprocess
             expr_text = self._preprocess_math_text(expr_text)
             
-            expr = sp.sympify(expr_text)
-            latex = sp.latex(expr)
+            latex, plain = sympify_latex(expr_text)
             
             return {
                 'latex': latex,
-                'plain_text': str(expr),
+                'plain_text': plain,
                 'method_used': 'nlp',
                 'confidence': 0.6
             }
-        except Exception as e:
-            print(f"NLP simple expression parsing error: {e}")
+        except SYMPIFY_ERRORS as e:
+            logger.debug("NLP simple expression parsing error: %s", e)
             return None
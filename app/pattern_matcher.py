@@ -1,113 +1,148 @@
+import logging
 import re
-from typing import Optional, Dict, Tuple
-import sympy as sp
-from app.utils import TextNormalizer
+from functools import lru_cache, partial
+from typing import Optional, Dict, List
+from app.utils import NORMALIZER, SYMPIFY_ERRORS, sympify_latex
+
+logger = logging.getLogger(__name__)
+
+# Characters an expression may be written with; pattern captures are limited to them
+_EXPR_CHARS = r'[\w\s+\-*/^().,!]'
+
 
 class PatternMatcher:
     """Rule-based pattern matching for common mathematical expressions"""
     
+    # Common word-to-symbol mappings
+    word_to_symbol = {
+        'plus': '+',
+        'minus': '-',
+        'times': '*',
+        'multiply': '*',
+        'multiplied by': '*',
+        'divided by': '/',
+        'divide by': '/',
+        'over': '/',
+        'square root': 'sqrt',
+        'cube root': 'cbrt',
+        'sqrt': 'sqrt',
+    }
+    
+    # Trig function mappings
+    trig_functions = ('sin', 'cos', 'tan', 'sec', 'csc', 'cot',
+                      'sinh', 'cosh', 'tanh', 'arcsin', 'arccos', 'arctan',
+                      'asin', 'acos', 'atan')
+    
+    # Regexes for _preprocess_expression and the handlers, compiled once at import
+    # (case-sensitive: they only see slices of normalized, lowercase text)
+    # Longest words first so "square root" wins over "square"
+    _word_re = re.compile(r'\b(' + '|'.join(
+        re.escape(word) for word in sorted(word_to_symbol, key=len, reverse=True)
+    ) + r')\b')
+    # "x squared", "x square", "(x+1) cubed", ... -> "x^2", "(x+1)^3"
+    powers = {'squared': '^2', 'square': '^2', 'cubed': '^3', 'cube': '^3'}
+    _powers_re = re.compile(r'\s*\b(squared|square|cubed|cube)\b')
+    _power_re = re.compile(r'([a-zA-Z0-9]+)\s+to\s+the\s+(?:power\s+of\s+)?(\d+)(?:th|rd|nd|st)?')
+    # Trig functions plus log/ln/exp: "sin x" -> "sin(x)" in one pass
+    _trig_re = re.compile(
+        r'\b(' + '|'.join(trig_functions + ('log', 'ln', 'exp')) + r')\s+([a-zA-Z0-9]+)'
+    )
+    _implicit_mul_re = re.compile(r'(\d+|[a-zA-Z](?:\^\d+)?)\s+([a-zA-Z])')
+    # Characters a preprocessed expression may contain; anything else can't sympify
+    # cleanly, so the handler rejects it without raising
+    _valid_expr_re = re.compile(rf'^{_EXPR_CHARS}+$')
+    
     def __init__(self):
-        self.normalizer = TextNormalizer()
-        
-        # Common word-to-symbol mappings
-        self.word_to_symbol = {
-            'plus': '+',
-            'minus': '-',
-            'times': '*',
-            'multiply': '*',
-            'multiplied by': '*',
-            'divided by': '/',
-            'divide by': '/',
-            'over': '/',
-            'squared': '^2',
-            'square': '^2',  # Accept both!
-            'cubed': '^3',
-            'cube': '^3',  # Accept both!
-            'square root': 'sqrt',
-            'cube root': 'cbrt',
-            'sqrt': 'sqrt',
-        }
-        
-        # Trig function mappings
-        self.trig_functions = ['sin', 'cos', 'tan', 'sec', 'csc', 'cot', 
-                               'sinh', 'cosh', 'tanh', 'arcsin', 'arccos', 'arctan',
-                               'asin', 'acos', 'atan']
+        self.normalizer = NORMALIZER
         
-        # Define patterns with their handlers
+        # Define patterns with their handlers and the literal keywords they need (any one)
         self.patterns = [
             # Integration patterns - more flexible
-            (r'integrate\s+(.+?)\s+(?:with\s+respect\s+to|wrt|w\.?r\.?t\.?)\s+([a-zA-Z])', self._handle_integral),
-            (r'integral\s+of\s+(.+?)\s+(?:d|with\s+respect\s+to)\s*([a-zA-Z])', self._handle_integral),
-            (r'integrate\s+(.+?)\s+d([a-zA-Z])', self._handle_integral),
-            (r'int\s+(.+?)\s+d([a-zA-Z])', self._handle_integral),
+            (rf'integrate\s+({_EXPR_CHARS}+?)\s+(?:with\s+respect\s+to|wrt|w\.?r\.?t\.?)\s+([a-zA-Z])', self._handle_integral, ('integrate',)),
+            (rf'integral\s+of\s+({_EXPR_CHARS}+?)\s+(?:d|with\s+respect\s+to)\s*([a-zA-Z])', self._handle_integral, ('integral',)),
+            (rf'integrate\s+({_EXPR_CHARS}+?)\s+d([a-zA-Z])', self._handle_integral, ('integrate',)),
+            (rf'int\s+({_EXPR_CHARS}+?)\s+d([a-zA-Z])', self._handle_integral, ('int',)),
             
             # Derivative patterns - more flexible
-            (r'derivative\s+of\s+(.+?)\s+(?:with\s+respect\s+to|wrt)\s+([a-zA-Z])', self._handle_derivative),
-            (r'differentiate\s+(.+?)\s+(?:with\s+respect\s+to|wrt)\s+([a-zA-Z])', self._handle_derivative),
-            (r'deriv(?:ative)?\s+of\s+(.+?)\s+(?:with\s+respect\s+to|wrt)\s+([a-zA-Z])', self._handle_derivative),
-            (r'd/d([a-zA-Z])\s+(?:of\s+)?(.+)', self._handle_derivative_short),
+            (rf'derivative\s+of\s+(?P<expr>{_EXPR_CHARS}+?)\s+(?:with\s+respect\s+to|wrt)\s+(?P<var>[a-zA-Z])', self._handle_derivative, ('derivative',)),
+            (rf'differentiate\s+(?P<expr>{_EXPR_CHARS}+?)\s+(?:with\s+respect\s+to|wrt)\s+(?P<var>[a-zA-Z])', self._handle_derivative, ('differentiate',)),
+            (r'd/d(?P<var>[a-zA-Z])\s+(?:of\s+)?(?P<expr>.+)', partial(self._handle_derivative, confidence=0.85), ('d/d',)),
             
             # Partial derivative patterns (NEW) - more specific ordering
-            (r'partial\s+derivative\s+of\s+(.+?)\s+(?:with\s+respect\s+to|wrt)\s+([a-zA-Z])', self._handle_partial),
-            (r'partial\s+(.+?)\s+(?:with\s+respect\s+to|wrt)\s+([a-zA-Z])', self._handle_partial),
+            (rf'partial\s+derivative\s+of\s+({_EXPR_CHARS}+?)\s+(?:with\s+respect\s+to|wrt)\s+([a-zA-Z])', self._handle_partial, ('partial',)),
+            (rf'partial\s+(?:of\s+)?({_EXPR_CHARS}+?)\s+(?:with\s+respect\s+to|wrt)\s+([a-zA-Z])', self._handle_partial, ('partial',)),
             
             # Summation patterns
-            (r'sum\s+(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)\s+(?:of\s+)?(.+)', self._handle_summation),
-            (r'summation\s+(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)\s+(?:of\s+)?(.+)', self._handle_summation),
-            (r'sigma\s+(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)\s+(?:of\s+)?(.+)', self._handle_summation),
+            (r'sum\s+(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)\s+(?:of\s+)?(.+)', self._handle_summation, ('sum',)),
+            (r'summation\s+(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)\s+(?:of\s+)?(.+)', self._handle_summation, ('summation',)),
+            (r'sigma\s+(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)\s+(?:of\s+)?(.+)', self._handle_summation, ('sigma',)),
             
             # Product patterns (NEW)
-            (r'product\s+(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)\s+(?:of\s+)?(.+)', self._handle_product),
+            (r'product\s+(?:from|of)\s+([a-zA-Z])\s*(?:equals|=)\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)\s+(?:of\s+)?(.+)', self._handle_product, ('product',)),
             
             # Limit patterns
-            (r'limit\s+as\s+([a-zA-Z])\s+(?:approaches|goes\s+to|tends\s+to)\s+(.+?)\s+of\s+(.+)', self._handle_limit),
-            (r'lim\s+([a-zA-Z])\s*->\s*(.+?)\s+(?:of\s+)?(.+)', self._handle_limit),
+            (r'limit\s+as\s+([a-zA-Z])\s+(?:approaches|goes\s+to|tends\s+to)\s+(.+?)\s+of\s+(.+)', self._handle_limit, ('limit',)),
+            (r'lim\s+([a-zA-Z])\s*->\s*(.+?)\s+(?:of\s+)?(.+)', self._handle_limit, ('lim',)),
             
             # Fraction patterns (NEW) - Put this at the end to avoid conflicts
-            (r'(.+?)\s+(?:divided\s+by|over)\s+(.+)', self._handle_fraction),
+            (rf'^({_EXPR_CHARS}+?)\s+(?:divided\s+by|over)\s+(.+)', self._handle_fraction, ('over', 'divided')),
         ]
+        # Patterns are case-sensitive: parse() only sees normalized (lowercase) text
+        self._keyword_dispatch: Dict[str, List[int]] = {}
+        for i, (_, _, keywords) in enumerate(self.patterns):
+            for keyword in keywords:
+                self._keyword_dispatch.setdefault(keyword, []).append(i)
+        self.patterns = [(re.compile(pattern), handler) for pattern, handler, _ in self.patterns]
+        # Memoized per instance; like NLPProcessor's cache this forms an instance -> cache ->
+        # bound method -> instance cycle, freed by the cyclic GC (one matcher per process)
+        self._parse_cached = lru_cache(maxsize=2048)(self._parse_impl)
     
-    def parse(self, text: str) -> Optional[Dict]:
+    def parse(self, text: str, already_normalized: bool = False) -> Optional[Dict]:
         """Try to match text against patterns"""
-        # First normalize the text
-        text = self.normalizer.normalize(text)
-        text = text.lower().strip()
+        result = self._parse_cached(text, already_normalized)
+        # Hand out a copy so callers can't alter the cached result
+        return dict(result) if result else None
+    
+    def _parse_impl(self, text: str, already_normalized: bool) -> Optional[Dict]:
+        """Match text against patterns (memoized per instance as _parse_cached)"""
+        # First normalize the text (unless the caller already did)
+        if not already_normalized:
+            text = self.normalizer.normalize(text)
         
-        # Try each pattern
-        for pattern, handler in self.patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        # Try the candidates in priority order
+        for i in self._candidates(text):
+            pattern, handler = self.patterns[i]
+            match = pattern.search(text)
             if match:
                 try:
                     result = handler(match)
                     if result:
                         return result
                 except Exception as e:
-                    print(f"Error in handler: {e}")
+                    logger.debug("Error in handler: %s", e)
                     continue
         
         return None
     
+    def _candidates(self, text: str) -> List[int]:
+        """Indices of the patterns whose keyword occurs in text (the only ones that can match)"""
+        return sorted({
+            i for keyword, indices in self._keyword_dispatch.items() if keyword in text for i in indices
+        })
+    
     def _preprocess_expression(self, expr: str) -> str:
         """Preprocess expression to convert words to symbols"""
         expr = expr.strip()
         
         # Replace word representations with symbols
-        for word, symbol in self.word_to_symbol.items():
-            expr = re.sub(r'\b' + word + r'\b', symbol, expr, flags=re.IGNORECASE)
+        expr = self._word_re.sub(lambda m: self.word_to_symbol[m.group(1)], expr)
         
         # Handle "x squared", "x square", "y cubed", "y cube" etc
-        expr = re.sub(r'([a-zA-Z0-9]+)\s+(?:squared|square)', r'\1^2', expr, flags=re.IGNORECASE)
-        expr = re.sub(r'([a-zA-Z0-9]+)\s+(?:cubed|cube)', r'\1^3', expr, flags=re.IGNORECASE)
-        expr = re.sub(r'([a-zA-Z0-9]+)\s+to\s+the\s+(?:power\s+of\s+)?(\d+)(?:th|rd|nd|st)?', r'\1^\2', expr, flags=re.IGNORECASE)
+        expr = self._powers_re.sub(lambda m: self.powers[m.group(1)], expr)
+        expr = self._power_re.sub(r'\1^\2', expr)
         
-        # Handle trig functions: "sin x" -> "sin(x)"
-        for func in self.trig_functions:
-            expr = re.sub(rf'\b{func}\s+([a-zA-Z0-9]+)', rf'{func}(\1)', expr, flags=re.IGNORECASE)
-        
-        # Handle other common functions
-        expr = re.sub(r'\blog\s+([a-zA-Z0-9]+)', r'log(\1)', expr, flags=re.IGNORECASE)
-        expr = re.sub(r'\bln\s+([a-zA-Z0-9]+)', r'ln(\1)', expr, flags=re.IGNORECASE)
-        expr = re.sub(r'\bexp\s+([a-zA-Z0-9]+)', r'exp(\1)', expr, flags=re.IGNORECASE)
+        # Handle trig and other common functions: "sin x" -> "sin(x)"
+        expr = self._trig_re.sub(r'\1(\2)', expr)
         
         return expr
     
@@ -117,69 +152,48 @@ class PatternMatcher:
         var = match.group(2).strip()
         
         expr_str = self._preprocess_expression(expr_str)
+        if not self._valid_expr_re.match(expr_str):
+            return None
         
         try:
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_str)
-            
-            latex = f"\\int {sp.latex(expr)} \\, d{var}"
-            plain = f"Integral of {expr} with respect to {var}"
-            
-            return {
-                'latex': latex,
-                'plain_text': plain,
-                'method_used': 'pattern_matching',
-                'confidence': 0.9
-            }
-        except Exception as e:
-            print(f"Integral error: {e}")
+            expr_latex, expr_plain = sympify_latex(expr_str)
+        except SYMPIFY_ERRORS as e:
+            logger.debug("Integral error: %s", e)
             return None
-    
-    def _handle_derivative(self, match) -> Dict:
-        """Handle derivative patterns"""
-        expr_str = match.group(1).strip()
-        var = match.group(2).strip()
         
-        expr_str = self._preprocess_expression(expr_str)
+        latex = f"\\int {expr_latex} \\, d{var}"
+        plain = f"Integral of {expr_plain} with respect to {var}"
         
-        try:
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_str)
-            
-            latex = f"\\frac{{d}}{{d{var}}} {sp.latex(expr)}"
-            plain = f"Derivative of {expr} with respect to {var}"
-            
-            return {
-                'latex': latex,
-                'plain_text': plain,
-                'method_used': 'pattern_matching',
-                'confidence': 0.9
-            }
-        except:
-            return None
+        return {
+            'latex': latex,
+            'plain_text': plain,
+            'method_used': 'pattern_matching',
+            'confidence': 0.9
+        }
     
-    def _handle_derivative_short(self, match) -> Dict:
-        """Handle d/dx notation"""
-        var = match.group(1).strip()
-        expr_str = match.group(2).strip()
+    def _handle_derivative(self, match, confidence: float = 0.9) -> Dict:
+        """Handle derivative patterns, including d/dx notation"""
+        expr_str = match.group('expr').strip()
+        var = match.group('var').strip()
         
         expr_str = self._preprocess_expression(expr_str)
+        if not self._valid_expr_re.match(expr_str):
+            return None
         
         try:
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_str)
-            
-            latex = f"\\frac{{d}}{{d{var}}} {sp.latex(expr)}"
-            plain = f"Derivative of {expr} with respect to {var}"
-            
-            return {
-                'latex': latex,
-                'plain_text': plain,
-                'method_used': 'pattern_matching',
-                'confidence': 0.85
-            }
-        except:
+            expr_latex, expr_plain = sympify_latex(expr_str)
+        except SYMPIFY_ERRORS:
             return None
+        
+        latex = f"\\frac{{d}}{{d{var}}} {expr_latex}"
+        plain = f"Derivative of {expr_plain} with respect to {var}"
+        
+        return {
+            'latex': latex,
+            'plain_text': plain,
+            'method_used': 'pattern_matching',
+            'confidence': confidence
+        }
     
     def _handle_summation(self, match) -> Dict:
         """Handle summation patterns"""
@@ -189,27 +203,24 @@ class PatternMatcher:
         expr_str = match.group(4).strip()
         
         expr_str = self._preprocess_expression(expr_str)
-        
-        # Additional preprocessing for summation variable
-        expr_str = re.sub(rf'\b{var}\s+(?:squared|square)', f'{var}^2', expr_str, flags=re.IGNORECASE)
-        expr_str = re.sub(rf'\b{var}\s+(?:cubed|cube)', f'{var}^3', expr_str, flags=re.IGNORECASE)
+        if not self._valid_expr_re.match(expr_str):
+            return None
         
         try:
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_str)
-            
-            latex = f"\\sum_{{{var}={start}}}^{{{end}}} {sp.latex(expr)}"
-            plain = f"Sum from {var}={start} to {end} of {expr}"
-            
-            return {
-                'latex': latex,
-                'plain_text': plain,
-                'method_used': 'pattern_matching',
-                'confidence': 0.9
-            }
-        except Exception as e:
-            print(f"Summation error: {e}")
+            expr_latex, expr_plain = sympify_latex(expr_str)
+        except SYMPIFY_ERRORS as e:
+            logger.debug("Summation error: %s", e)
             return None
+        
+        latex = f"\\sum_{{{var}={start}}}^{{{end}}} {expr_latex}"
+        plain = f"Sum from {var}={start} to {end} of {expr_plain}"
+        
+        return {
+            'latex': latex,
+            'plain_text': plain,
+            'method_used': 'pattern_matching',
+            'confidence': 0.9
+        }
     
     def _handle_product(self, match) -> Dict:
         """Handle product patterns (NEW)"""
@@ -219,23 +230,24 @@ class PatternMatcher:
         expr_str = match.group(4).strip()
         
         expr_str = self._preprocess_expression(expr_str)
+        if not self._valid_expr_re.match(expr_str):
+            return None
         
         try:
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_str)
-            
-            latex = f"\\prod_{{{var}={start}}}^{{{end}}} {sp.latex(expr)}"
-            plain = f"Product from {var}={start} to {end} of {expr}"
-            
-            return {
-                'latex': latex,
-                'plain_text': plain,
-                'method_used': 'pattern_matching',
-                'confidence': 0.9
-            }
-        except Exception as e:
-            print(f"Product error: {e}")
+            expr_latex, expr_plain = sympify_latex(expr_str)
+        except SYMPIFY_ERRORS as e:
+            logger.debug("Product error: %s", e)
             return None
+        
+        latex = f"\\prod_{{{var}={start}}}^{{{end}}} {expr_latex}"
+        plain = f"Product from {var}={start} to {end} of {expr_plain}"
+        
+        return {
+            'latex': latex,
+            'plain_text': plain,
+            'method_used': 'pattern_matching',
+            'confidence': 0.9
+        }
     
     def _handle_limit(self, match) -> Dict:
         """Handle limit patterns"""
@@ -244,57 +256,56 @@ class PatternMatcher:
         expr_str = match.group(3).strip()
         
         expr_str = self._preprocess_expression(expr_str)
+        if not self._valid_expr_re.match(expr_str):
+            return None
         
         try:
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_str)
-            
-            # Handle infinity
-            if approach.lower() in ['infinity', 'inf', '∞']:
-                approach = '\\infty'
-            
-            latex = f"\\lim_{{{var} \\to {approach}}} {sp.latex(expr)}"
-            plain = f"Limit as {var} approaches {approach} of {expr}"
-            
-            return {
-                'latex': latex,
-                'plain_text': plain,
-                'method_used': 'pattern_matching',
-                'confidence': 0.85
-            }
-        except:
+            expr_latex, expr_plain = sympify_latex(expr_str)
+        except SYMPIFY_ERRORS:
             return None
+        
+        # Handle infinity
+        if approach.lower() in ['infinity', 'inf', '∞']:
+            approach = '\\infty'
+        
+        latex = f"\\lim_{{{var} \\to {approach}}} {expr_latex}"
+        plain = f"Limit as {var} approaches {approach} of {expr_plain}"
+        
+        return {
+            'latex': latex,
+            'plain_text': plain,
+            'method_used': 'pattern_matching',
+            'confidence': 0.85
+        }
     
     def _handle_partial(self, match) -> Dict:
         """Handle partial derivative patterns (IMPROVED)"""
         expr_str = match.group(1).strip()
         var = match.group(2).strip()
         
-        # Remove "of" if it's at the start
-        expr_str = re.sub(r'^of\s+', '', expr_str)
-        
         expr_str = self._preprocess_expression(expr_str)
         
         # Handle implicit multiplication like "x squared y" -> "x^2*y"
         # Match patterns like "x^2 y" or "2 x" and insert multiplication
-        expr_str = re.sub(r'(\d+|[a-zA-Z](?:\^\d+)?)\s+([a-zA-Z])', r'\1*\2', expr_str)
+        expr_str = self._implicit_mul_re.sub(r'\1*\2', expr_str)
+        if not self._valid_expr_re.match(expr_str):
+            return None
         
         try:
-            var_sym = sp.Symbol(var)
-            expr = sp.sympify(expr_str)
-            
-            latex = f"\\frac{{\\partial}}{{\\partial {var}}} {sp.latex(expr)}"
-            plain = f"Partial derivative of {expr} with respect to {var}"
-            
-            return {
-                'latex': latex,
-                'plain_text': plain,
-                'method_used': 'pattern_matching',
-                'confidence': 0.85
-            }
-        except Exception as e:
-            print(f"Partial derivative error: {e}")
+            expr_latex, expr_plain = sympify_latex(expr_str)
+        except SYMPIFY_ERRORS as e:
+            logger.debug("Partial derivative error: %s", e)
             return None
+        
+        latex = f"\\frac{{\\partial}}{{\\partial {var}}} {expr_latex}"
+        plain = f"Partial derivative of {expr_plain} with respect to {var}"
+        
+        return {
+            'latex': latex,
+            'plain_text': plain,
+            'method_used': 'pattern_matching',
+            'confidence': 0.85
+        }
     
     def _handle_fraction(self, match) -> Dict:
         """Handle fraction patterns (NEW)"""
@@ -303,19 +314,21 @@ class PatternMatcher:
         
         numerator = self._preprocess_expression(numerator)
         denominator = self._preprocess_expression(denominator)
+        if not (self._valid_expr_re.match(numerator) and self._valid_expr_re.match(denominator)):
+            return None
         
         try:
-            num_expr = sp.sympify(numerator)
-            den_expr = sp.sympify(denominator)
-            
-            latex = f"\\frac{{{sp.latex(num_expr)}}}{{{sp.latex(den_expr)}}}"
-            plain = f"({num_expr}) / ({den_expr})"
-            
-            return {
-                'latex': latex,
-                'plain_text': plain,
-                'method_used': 'pattern_matching',
-                'confidence': 0.8
-            }
-        except:
+            num_latex, num_plain = sympify_latex(numerator)
+            den_latex, den_plain = sympify_latex(denominator)
+        except SYMPIFY_ERRORS:
             return None
+        
+        latex = f"\\frac{{{num_latex}}}{{{den_latex}}}"
+        plain = f"({num_plain}) / ({den_plain})"
+        
+        return {
+            'latex': latex,
+            'plain_text': plain,
+            'method_used': 'pattern_matching',
+            'confidence': 0.8
+        }
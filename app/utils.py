@@ -1,61 +1,125 @@
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
+import sympy as sp
+
+# Longest expression handed to SymPy by either parser, to bound sympify time on crafted
+# input; longer expressions raise ValueError and the handler gives up on them
+_MAX_EXPR_LEN = 200
+
+# What sympify_latex raises for text that is not a valid expression
+SYMPIFY_ERRORS = (sp.SympifyError, SyntaxError, TypeError, ValueError, AttributeError, ArithmeticError)
+
+# Expressions SymPy would print unchanged apart from brace-wrapping the exponent:
+# a lowercase letter, an integer, or a letter raised to an integer power of 2 or more
+_TRIVIAL_EXPR_RE = re.compile(r'([a-z])(?:\^([2-9]|[1-9]\d+))?|0|[1-9]\d*')
+
+@lru_cache(maxsize=2048)
+def sympify_latex(expr_str: str) -> Tuple[str, str]:
+    """Sympify an expression once and return its (latex, plain text) forms"""
+    if len(expr_str) > _MAX_EXPR_LEN:
+        raise ValueError(f"expression longer than {_MAX_EXPR_LEN} characters")
+    
+    # Render trivial expressions directly, skipping the SymPy round-trip
+    trivial = _TRIVIAL_EXPR_RE.fullmatch(expr_str)
+    if trivial:
+        base, exponent = trivial.groups()
+        if base is None:
+            return expr_str, expr_str
+        if exponent is None:
+            return base, base
+        return f"{base}^{{{exponent}}}", f"{base}**{exponent}"
+    
+    expr = sp.sympify(expr_str)
+    return sp.latex(expr), str(expr)
+
+def _compile_alternation(words: Dict[str, str]) -> re.Pattern:
+    """Compile a whole-word alternation of the keys of words"""
+    return re.compile(r'\b(' + '|'.join(
+        re.escape(word) for word in sorted(words, key=len, reverse=True)
+    ) + r')\b')
 
 class TextNormalizer:
     """Normalize and clean mathematical text input"""
     
-    def __init__(self):
-        # Common typos and variations
-        self.typo_corrections = {
-            'square': 'squared',
-            'cube': 'cubed',
-            'sqaure': 'squared',  # typo
-            'sqared': 'squared',  # typo
-            'intergrate': 'integrate',  # typo
-            'integrat': 'integrate',  # typo
-            'derivate': 'derivative',  # typo
-            'diferentiate': 'differentiate',  # typo
-            'diferential': 'differential',  # typo
-            'summaton': 'summation',  # typo
-            'sumation': 'summation',  # typo
-        }
-        
-        # Synonyms for operations
-        self.synonyms = {
-            'diff': 'derivative',
-            'deriv': 'derivative',
-            'd/dx': 'derivative',
-            'int': 'integrate',
-            'sigma': 'sum',
-            'Σ': 'sum',
-        }
-        
-        # Word normalizations
-        self.normalizations = {
-            r'\bwrt\b': 'with respect to',
-            r'\bw\.r\.t\.?\b': 'with respect to',
-            r'\brt\b': 'with respect to',
-            r'\^': ' to the power of ',
-        }
+    # Common typos and variations
+    typo_corrections = {
+        'square': 'squared',
+        'cube': 'cubed',
+        'sqaure': 'squared',  # typo
+        'sqared': 'squared',  # typo
+        'intergrate': 'integrate',  # typo
+        'integrat': 'integrate',  # typo
+        'derivate': 'derivative',  # typo
+        'diferentiate': 'differentiate',  # typo
+        'diferential': 'differential',  # typo
+        'summaton': 'summation',  # typo
+        'sumation': 'summation',  # typo
+        # Kept as is, so "square"/"cube" above don't turn them into "squared root"/"cubed root"
+        'square root': 'square root',
+        'cube root': 'cube root',
+    }
+    
+    # Synonyms for operations
+    synonyms = {
+        'diff': 'derivative',
+        'deriv': 'derivative',
+        'd/dx': 'derivative',
+        'int': 'integrate',
+        'sigma': 'sum',
+        'Σ': 'sum',
+    }
+    
+    # Word normalizations
+    normalizations = {
+        r'\bwrt\b': 'with respect to',
+        r'\bw\.r\.t\.?\b': 'with respect to',
+        r'\brt\b': 'with respect to',
+    }
+    
+    # Typos and synonyms are each replaced in a single pass (longest keys first);
+    # everything is compiled once at import
+    _typos_re = _compile_alternation(typo_corrections)
+    _synonyms_re = _compile_alternation(synonyms)
+    _normalization_patterns = [
+        (re.compile(pattern), replacement)
+        for pattern, replacement in normalizations.items()
+    ]
+    
+    # Substrings that must be present for each substitution family to change anything,
+    # checked first since most inputs contain none of them
+    _typo_keys = tuple(typo_corrections)
+    _synonym_keys = tuple(synonyms)
+    _normalization_keys = ('rt', 'w.r.t')  # "rt" also covers "wrt"
+    
+    # Entity extraction
+    _entity_trig_re = re.compile(r'\b(sin|cos|tan|sec|csc|cot|sinh|cosh|tanh)\b')
+    _entity_variable_re = re.compile(r'\b([a-zA-Z])\b')
+    _entity_number_re = re.compile(r'\b(\d+(?:\.\d+)?)\b')
     
     def normalize(self, text: str) -> str:
         """Apply all normalizations to text"""
         text = text.lower().strip()
         
         # Fix common typos
-        for typo, correct in self.typo_corrections.items():
-            text = re.sub(r'\b' + typo + r'\b', correct, text)
+        if any(key in text for key in self._typo_keys):
+            text = self._typos_re.sub(lambda m: self.typo_corrections[m.group(1)], text)
         
         # Replace synonyms
-        for synonym, standard in self.synonyms.items():
-            text = re.sub(r'\b' + re.escape(synonym) + r'\b', standard, text)
+        if any(key in text for key in self._synonym_keys):
+            text = self._synonyms_re.sub(lambda m: self.synonyms[m.group(1)], text)
         
         # Apply normalizations
-        for pattern, replacement in self.normalizations.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        if any(key in text for key in self._normalization_keys):
+            for pattern, replacement in self._normalization_patterns:
+                text = pattern.sub(replacement, text)
+        
+        # Spell out powers
+        if '^' in text:
+            text = text.replace('^', ' to the power of ')
         
         # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = ' '.join(text.split())
         
         return text
     
@@ -68,18 +132,19 @@ class TextNormalizer:
             'operations': []
         }
         
-        # Extract trig functions
-        trig_funcs = ['sin', 'cos', 'tan', 'sec', 'csc', 'cot', 'sinh', 'cosh', 'tanh']
-        for func in trig_funcs:
-            if func in text:
-                entities['functions'].append(func)
+        # Extract trig functions (in order of first appearance)
+        entities['functions'] = list(dict.fromkeys(self._entity_trig_re.findall(text)))
         
         # Extract variables (single letters)
-        variables = re.findall(r'\b([a-zA-Z])\b', text)
-        entities['variables'] = list(set(variables))
+        variables = self._entity_variable_re.findall(text)
+        entities['variables'] = list(dict.fromkeys(variables))
         
         # Extract numbers
-        numbers = re.findall(r'\b(\d+(?:\.\d+)?)\b', text)
+        numbers = self._entity_number_re.findall(text)
         entities['numbers'] = numbers
         
         return entities
+
+
+# TextNormalizer keeps no per-instance state, so the parsers and the API share one
+NORMALIZER = TextNormalizer()
@@ -0,0 +1,27 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    # Entering the client runs the lifespan, so requests go through the worker pool
+    with TestClient(app) as client:
+        yield client
+
+
+def test_parse_pattern_expression(client):
+    response = client.post("/parse", json={"text": "integrate x squared with respect to y"})
+    assert response.status_code == 200
+    assert response.json() == {
+        "latex": r"\int x^{2} \, dy",
+        "plain_text": "Integral of x**2 with respect to y",
+        "method_used": "pattern_matching",
+        "confidence": 0.9
+    }
+
+
+def test_parse_unparseable_expression_returns_422(client):
+    """SymPy errors such as modulo by zero are reported as a failed parse"""
+    response = client.post("/parse", json={"text": "5 % 0"})
+    assert response.status_code == 422
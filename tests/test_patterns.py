@@ -0,0 +1,110 @@
+import string
+import sympy as sp
+from app.nlp_processor import NLPProcessor
+from app.pattern_matcher import PatternMatcher
+from app.utils import sympify_latex
+
+nlp_processor = NLPProcessor()
+pattern_matcher = PatternMatcher()
+
+
+def test_nlp_summation_keeps_filler_word_index():
+    """The index "i" is also a filler word, but must survive in the summand"""
+    result = nlp_processor.parse("sum from i=1 to n of i squared")
+    assert result['latex'] == r"\sum_{i=1}^{n} i^{2}"
+
+
+def test_nlp_product():
+    result = nlp_processor.parse("product of k = 1 to n of k plus 1")
+    assert result['latex'] == r"\prod_{k=1}^{n} k + 1"
+
+
+def test_nlp_summation():
+    result = nlp_processor.parse("summation from k=0 to 10 of k cubed")
+    assert result['latex'] == r"\sum_{k=0}^{10} k^{3}"
+
+
+def test_pattern_expression_length_cap():
+    """Expressions longer than 200 characters are not handed to SymPy"""
+    short = pattern_matcher.parse("integrate " + "x plus " * 49 + "x with respect to x")
+    assert short['latex'] == r"\int 50 x \, dx"
+    assert pattern_matcher.parse("integrate " + "x plus " * 50 + "x with respect to x") is None
+
+
+def test_pattern_prefilter_skips_non_math_input():
+    """Text without any pattern keyword is rejected before a pattern runs"""
+    matcher = PatternMatcher()
+    matcher.patterns = None  # any pattern lookup would raise
+    assert matcher.parse("what is the weather like today") is None
+
+
+def test_pattern_prefilter_keeps_every_matching_pattern():
+    """Each pattern that matches an input is among that input's keyword candidates"""
+    inputs = [
+        "integrate x squared with respect to y", "integrate sin x dx", "integral of x dx",
+        "∫ x dx", "derivative of x cubed wrt x", "differentiate cos x with respect to x",
+        "d/dx of x squared", "d/dy y cubed", "partial derivative of x squared y wrt x",
+        "partial of x y wrt y", "sum from i=1 to n of i squared", "summation of k = 0 to 10 of k",
+        "sigma from i=1 to n of i", "product from i=1 to n of i", "limit as x approaches 0 of sin x over x",
+        "lim x -> 0 of x squared", "x squared plus 1 over x minus 1", "1 divided by x", "^2 over x",
+    ]
+    for text in inputs:
+        text = pattern_matcher.normalizer.normalize(text)
+        matched = [i for i, (pattern, _) in enumerate(pattern_matcher.patterns) if pattern.search(text)]
+        assert set(matched) <= set(pattern_matcher._candidates(text)), text
+
+
+def test_pattern_square_root_is_not_read_as_squared():
+    """"square root" becomes sqrt end to end, while a lone "square" still means ^2"""
+    result = pattern_matcher.parse("integrate square root (x) plus x square wrt x")
+    assert result['latex'] == r"\int \sqrt{x} + x^{2} \, dx"
+    result = pattern_matcher.parse("x square over cube root (x)")
+    assert result['latex'] == r"\frac{x^{2}}{\sqrt[3]{x}}"
+
+
+def test_pattern_power_words_apply_to_parenthesised_base():
+    assert pattern_matcher._preprocess_expression("(x plus 1) cubed") == "(x + 1)^3"
+    result = pattern_matcher.parse("derivative of (x plus 1) cubed wrt x")
+    assert result['latex'] == r"\frac{d}{dx} \left(x + 1\right)^{3}"
+
+
+def test_trivial_expressions_render_like_sympy():
+    """The fast path that skips SymPy gives exactly SymPy's output"""
+    exprs = list(string.ascii_lowercase) + ["0", "7", "42", "123456789012345678901234567890"]
+    exprs += [f"{letter}^{n}" for letter in "xyeinq" for n in (2, 3, 9, 10, 123)]
+    for expr_str in exprs:
+        expr = sp.sympify(expr_str)
+        assert sympify_latex(expr_str) == (sp.latex(expr), str(expr)), expr_str
+
+
+def test_pattern_parse_returns_a_copy_of_the_cached_result():
+    matcher = PatternMatcher()
+    result = matcher.parse("integrate x squared with respect to y")
+    result['latex'] = "changed"
+    assert matcher.parse("integrate x squared with respect to y")['latex'] == r"\int x^{2} \, dy"
+
+
+def test_pattern_derivative_confidence():
+    """d/dx notation goes through the shared derivative handler with lower confidence"""
+    short = pattern_matcher.parse("d/dt of t squared")
+    assert short['latex'] == r"\frac{d}{dt} t^{2}"
+    assert short['confidence'] == 0.85
+    assert pattern_matcher.parse("derivative of t squared wrt t")['confidence'] == 0.9
+
+
+def test_parsers_share_one_normalizer():
+    assert pattern_matcher.normalizer is nlp_processor.normalizer is PatternMatcher().normalizer
+
+
+def test_nlp_operation_matches_keyword_lookup_in_mapping_order():
+    """One regex scan picks the same operation as checking each keyword in turn"""
+    def first_operation(text):
+        for keyword, operation in nlp_processor.math_operations.items():
+            if keyword in text:
+                return operation
+        return None
+    
+    texts = ["partialimit", "integralimit", "sumproduct", "derivative of summation",
+             "differentiate x", "lim x to 0", "product of partial sums", "hello"]
+    for text in texts:
+        assert nlp_processor._extract_operation(text) == first_operation(text), text